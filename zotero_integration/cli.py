@@ -2,6 +2,8 @@ import click
 import httpx
 import re
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pyfzf import FzfPrompt
 from pyzotero import zotero
@@ -11,6 +13,30 @@ from datetime import datetime, timezone
 os.environ.pop("http_proxy", None)
 os.environ.pop("https_proxy", None)
 
+# Decode Zotero API responses with orjson when it is available
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    _httpx_response_json = httpx.Response.json
+
+    def _orjson_response_json(self, **kwargs):
+        if kwargs:
+            return _httpx_response_json(self, **kwargs)
+        return orjson.loads(self.content)
+
+    httpx.Response.json = _orjson_response_json
+
+# Tables and patterns used by sanitize_filename
+_BAD_CHARS_TABLE = str.maketrans("", "", '@$!<>"/\\|?*')
+_DASHES_RE = re.compile(r"-+")
+_EXT_RE = re.compile(r"\.[a-zA-Z0-9]+$")
+_LEADING_RE = re.compile(r"^[.^]+")
+
+# "Key: value" lines in the extra field
+_EXTRA_RE = re.compile(r"^([^:\n]+):[ \t]*(.*)$", re.MULTILINE)
+
 
 class ZoteroItem:
     def __init__(self, raw_item):
@@ -22,9 +48,7 @@ class ZoteroItem:
         """Parse the extra field into a dictionary of metadata"""
         if not extra_text:
             return {}
-        return dict(
-            tuple(line.split(":", 1)) for line in extra_text.split("\n") if ":" in line
-        )
+        return {k.strip(): v.strip() for k, v in _EXTRA_RE.findall(extra_text)}
 
     def get_authors(self):
         creators = self.data.get("creators", [])
@@ -60,8 +84,8 @@ class ZoteroItem:
             frontmatter["aliases"] = [self.get_short_title()]
 
         # Add mapped fields
-        for source_path, target_key in FRONTMATTER_MAPPING.items():
-            if value := get_nested_value(self.raw_item, source_path):
+        for source_parts, target_key in FRONTMATTER_MAPPING_COMPILED:
+            if value := get_nested_value(self.raw_item, source_parts):
                 if target_key == "authors":
                     frontmatter["authors"] = self.get_authors()
                 elif target_key == "tags":
@@ -104,19 +128,18 @@ def sanitize_filename(title):
     # Replace colons with space-dash
     filename = title.replace(":", " -")
     # Remove problematic characters
-    filename = re.sub(r'[@$!<>"/\\|?*]', "", filename)
+    filename = filename.translate(_BAD_CHARS_TABLE)
     # Remove multiple dashes
-    filename = re.sub(r"-+", "-", filename)
+    filename = _DASHES_RE.sub("-", filename)
     # Remove leading/trailing dashes and spaces
     filename = filename.strip("- ")
     
     # Remove . or ^ from start of filename instead of raising error
-    while filename.startswith(".") or filename.startswith("^"):
-        filename = filename[1:]
+    filename = _LEADING_RE.sub("", filename)
     
     # Check if the name (without .md) ends with any extension-like pattern
     name_without_md = filename[:-3] if filename.endswith(".md") else filename
-    if re.search(r'\.[a-zA-Z0-9]+$', name_without_md):
+    if _EXT_RE.search(name_without_md):
         print(f"Warning: '{name_without_md}' contains what appears to be a file extension")
     
     return f"{filename}.md"
@@ -136,11 +159,17 @@ FRONTMATTER_MAPPING = {
     "data.tags": "tags",
 }
 
+# Pre-split source paths so items don't re-split them on every lookup
+FRONTMATTER_MAPPING_COMPILED = tuple(
+    (tuple(source_path.split(".")), target_key)
+    for source_path, target_key in FRONTMATTER_MAPPING.items()
+)
 
-def get_nested_value(item, path):
-    """Get value from nested dictionary using dot notation path"""
+
+def get_nested_value(item, parts):
+    """Get value from nested dictionary using a pre-split path"""
     current = item
-    for part in path.split("."):
+    for part in parts:
         if isinstance(current, dict) and part in current:
             current = current[part]
         else:
@@ -148,21 +177,12 @@ def get_nested_value(item, path):
     return current
 
 
-def is_added_today(date_str):
-    """Check if the given date string is from today"""
-    if not date_str:
+def write_note(filepath, content):
+    """Write a note unless it already exists, returning whether it was written"""
+    if filepath.exists():
         return False
-
-    item_date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ").replace(
-        tzinfo=timezone.utc
-    )
-    today = datetime.now(timezone.utc)
-
-    return (
-        item_date.year == today.year
-        and item_date.month == today.month
-        and item_date.day == today.day
-    )
+    filepath.write_text(content)
+    return True
 
 
 class AliasedGroup(click.Group):
@@ -187,15 +207,25 @@ class AliasedGroup(click.Group):
 @click.pass_context
 def cli(ctx):
     """Synchronize Zotero literature with your knowledge vault"""
+    # Share one local client between the group and its subcommands
+    ctx.ensure_object(dict)
+    ctx.obj["zot"] = zotero.Zotero(
+        library_id=0, library_type="user", api_key="", local=True
+    )
     if ctx.invoked_subcommand is None:
         ctx.invoke(today)
 
 
 @cli.command()
-def today():
+@click.pass_context
+def today(ctx):
     """Create markdown files for items added today"""
-    zot = zotero.Zotero(library_id=0, library_type="user", api_key="", local=True)
-    zot.add_parameters(limit=50, sort="dateAdded", direction="desc")
+    # dateAdded is always "%Y-%m-%dT%H:%M:%SZ", so a date prefix match suffices
+    today_prefix = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    zot = ctx.obj["zot"]
+    zot.add_parameters(
+        limit=50, sort="dateAdded", direction="desc", itemType="-attachment"
+    )
     try:
         items = zot.items()
     except httpx.ConnectError:
@@ -206,40 +236,73 @@ def today():
     notes_dir = Path.home() / "Documents" / "Silverbullet" / "Literature_Note"
     notes_dir.mkdir(parents=True, exist_ok=True)
 
+    pending = {}
     for raw_item in items:
-        # Skip attachments
-        if raw_item["data"]["itemType"] == "attachment":
+        data = raw_item["data"]
+        # Skip attachments, in case the server ignores the itemType filter
+        if data["itemType"] == "attachment":
             continue
 
-        item = ZoteroItem(raw_item)
         # Skip items without titles
-        if not item.data.get("title"):
+        title = data.get("title")
+        if not title:
             continue
 
-        if is_added_today(item.data["dateAdded"]):
+        # Items come sorted by dateAdded descending, nothing after this is from today
+        date_added = data.get("dateAdded")
+        if date_added and date_added < today_prefix:
+            break
+
+        if date_added is not None and date_added.startswith(today_prefix):
             # Create filename from title
-            filename = sanitize_filename(item.data["title"])
+            filename = sanitize_filename(title)
             filepath = notes_dir / filename
 
-            # Only create file if it doesn't exist
-            if filepath.exists():
+            # Existing files are skipped by write_note
+            if filepath in pending:
                 continue
 
-            # Write to file
-            filepath.write_text(item.create_markdown())
-            print(f"Created: {filepath}")
+            pending[filepath] = ZoteroItem(raw_item).create_markdown()
+
+    if not pending:
+        return
+
+    # Write files concurrently, the writes are independent of each other
+    out = []
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(write_note, filepath, content): filepath
+                for filepath, content in pending.items()
+            }
+            for future, filepath in futures.items():
+                try:
+                    created = future.result()
+                except Exception as e:
+                    out.append(f"Error: Could not write {filepath}: {e}")
+                else:
+                    if created:
+                        out.append(f"Created: {filepath}")
+    finally:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
 
 @cli.command(name="search")
-def search():
+@click.pass_context
+def search(ctx):
     """Search through Zotero items using fzf"""
-    zot = zotero.Zotero(library_id=0, library_type="user", api_key="", local=True)
-    
-    # Get total number of items and use that as the limit
-    total_items = zot.count_items()
-    zot.add_parameters(limit=total_items, sort="dateAdded", direction="desc")
+    zot = ctx.obj["zot"]
 
+    # fzf needs every title up front, so fetch the whole library in one request
     try:
+        total_items = zot.count_items()
+        zot.add_parameters(
+            limit=total_items,
+            sort="dateAdded",
+            direction="desc",
+            itemType="-attachment",
+        )
         items = zot.items()
     except httpx.ConnectError:
         print("Error: Could not connect to Zotero. Please make sure Zotero is running.")
@@ -247,15 +310,16 @@ def search():
 
     # Filter out attachments and prepare titles for fzf
     titles = []
-    title_to_item = {}
+    title_to_raw = {}
     for raw_item in items:
-        if raw_item["data"]["itemType"] == "attachment":
+        data = raw_item["data"]
+        if data["itemType"] == "attachment":
             continue
-        item = ZoteroItem(raw_item)
-        if not item.data.get("title"):
+        title = data.get("title")
+        if not title:
             continue
-        titles.append(item.data["title"])
-        title_to_item[item.data["title"]] = item
+        titles.append(title)
+        title_to_raw[title] = raw_item
 
     # Use fzf to select a title
     fzf = FzfPrompt()
@@ -263,7 +327,7 @@ def search():
         selected = fzf.prompt(titles)[0]
 
         # Get the selected item
-        item = title_to_item[selected]
+        item = ZoteroItem(title_to_raw[selected])
 
         # Create filename and path
         filename = sanitize_filename(selected)